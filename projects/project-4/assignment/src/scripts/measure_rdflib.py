@@ -1,9 +1,7 @@
+import io
 import pandas as pd
-import sys
-from rdflib import Graph, Namespace, URIRef, Literal
-from rdflib.namespace import RDF, RDFS, XSD
-from dateutil import parser as dateparser
 import re
+import sys
 from pathlib import Path
 
 # ---- Paths ----
@@ -23,25 +21,31 @@ df = pd.read_csv(csv_file)
 print(f"[measure_rdflib] Loaded {len(df)} measurements")
 
 # ---- Namespaces ----
-EX = Namespace("http://example.org/")
-CCO = Namespace("https://www.commoncoreontologies.org/")
-BFO = Namespace("http://purl.obolibrary.org/obo/")
-
-# ---- Core IRIs ----
-IRI_ARTIFACT = URIRef("https://www.commoncoreontologies.org/ont00000995")
-IRI_SDC = URIRef("http://purl.obolibrary.org/obo/BFO_0000020")
-IRI_MICE = URIRef("https://www.commoncoreontologies.org/ont00001163")
-IRI_MU = URIRef("https://www.commoncoreontologies.org/ont00000120")
-
-IRI_BEARER_OF = URIRef("http://purl.obolibrary.org/obo/BFO_0000196")
-IRI_IS_MEASURE_OF = URIRef("https://www.commoncoreontologies.org/ont00001966")
-IRI_USES_MU = URIRef("https://www.commoncoreontologies.org/ont00001863")
-IRI_HAS_DATA_VALUE = URIRef("https://www.commoncoreontologies.org/has_data_value")
-IRI_MEASUREMENT_TIME = URIRef("https://www.commoncoreontologies.org/measurement_time")
+EX = "http://example.org/"
+CCO = "https://www.commoncoreontologies.org/"
+BFO = "http://purl.obolibrary.org/obo/"
+
+# ---- Core IRIs (pre-formatted N-Triples tokens) ----
+# The writer works on plain strings; rdflib is only touched for the
+# optional Jelly output at the end.
+IRI_ARTIFACT = "<https://www.commoncoreontologies.org/ont00000995>"
+IRI_SDC = "<http://purl.obolibrary.org/obo/BFO_0000020>"
+IRI_MICE = "<https://www.commoncoreontologies.org/ont00001163>"
+IRI_MU = "<https://www.commoncoreontologies.org/ont00000120>"
+
+IRI_BEARER_OF = "<http://purl.obolibrary.org/obo/BFO_0000196>"
+IRI_IS_MEASURE_OF = "<https://www.commoncoreontologies.org/ont00001966>"
+IRI_USES_MU = "<https://www.commoncoreontologies.org/ont00001863>"
+IRI_HAS_DATA_VALUE = "<https://www.commoncoreontologies.org/has_data_value>"
+IRI_MEASUREMENT_TIME = "<https://www.commoncoreontologies.org/measurement_time>"
+
+IRI_TYPE = "<http://www.w3.org/1999/02/22-rdf-syntax-ns#type>"
+IRI_LABEL = "<http://www.w3.org/2000/01/rdf-schema#label>"
+XSD_DECIMAL = "<http://www.w3.org/2001/XMLSchema#decimal>"
+XSD_DATETIME = "<http://www.w3.org/2001/XMLSchema#dateTime>"
 
 # ---- Normalization helpers ----
-def clean(x):
-    return re.sub(r"[^A-Za-z0-9_.-]", "_", str(x))
+_CLEAN_RE = re.compile(r"[^A-Za-z0-9_.-]")
 
 QUALITY_MAP = {
     "temperature": "temperature",
@@ -73,72 +77,204 @@ UNIT_LABELS = {
     "ohm": "ohm"
 }
 
-# ---- Graph ----
-g = Graph()
-g.bind("ex", EX)
-g.bind("cco", CCO)
-g.bind("bfo", BFO)
-
 artifacts_seen = set()
 qualities_seen = set()
+units_seen = set()
 
-# ---- Build triples ----
-for idx, row in df.iterrows():
-
-    artifact_id = clean(row["artifact_id"])
-
-    raw_quality = row["sdc_kind"].strip().lower()
-    quality_kind = QUALITY_MAP.get(raw_quality)
-    if not quality_kind:
-        raise ValueError(f"Unknown SDC kind: {row['sdc_kind']}")
-
-    raw_unit = row["unit_label"]
-    unit = UNIT_MAP.get(raw_unit)
-    if not unit:
-        raise ValueError(f"Unknown unit: {raw_unit}")
-
-    value = float(row["value"])
-    tstamp = dateparser.parse(row["timestamp"])
-
-    artifact_uri = EX[f"Artifact_{artifact_id}"]
-    quality_uri = EX[f"{artifact_id}_{quality_kind}_Quality"]
-    measurement_uri = EX[f"{artifact_id}_{quality_kind}_Measurement_{idx}"]
-    unit_uri = EX[f"Unit_{unit}"]
-
-    # Artifact
-    if artifact_uri not in artifacts_seen:
-        g.add((artifact_uri, RDF.type, IRI_ARTIFACT))
-        g.add((artifact_uri, RDFS.label, Literal(row["artifact_id"])))
-        artifacts_seen.add(artifact_uri)
-
-    # SDC
-    if quality_uri not in qualities_seen:
-        g.add((artifact_uri, IRI_BEARER_OF, quality_uri))
-        g.add((quality_uri, RDF.type, IRI_SDC))
-        g.add((quality_uri, RDFS.label,
-               Literal(f"{row['artifact_id']} {quality_kind} quality")))
-        qualities_seen.add(quality_uri)
-
-    # Measurement
-    g.add((measurement_uri, RDF.type, IRI_MICE))
-    g.add((measurement_uri, RDFS.label,
-           Literal(f"{row['artifact_id']} {quality_kind} measurement {idx}")))
-    g.add((measurement_uri, IRI_IS_MEASURE_OF, quality_uri))
-    g.add((measurement_uri, IRI_HAS_DATA_VALUE,
-           Literal(value, datatype=XSD.decimal)))
-    g.add((measurement_uri, IRI_MEASUREMENT_TIME,
-           Literal(tstamp.isoformat(), datatype=XSD.dateTime)))
-    g.add((measurement_uri, IRI_USES_MU, unit_uri))
-
-    # Unit
-    if (unit_uri, RDF.type, IRI_MU) not in g:
-        g.add((unit_uri, RDF.type, IRI_MU))
-        g.add((unit_uri, RDFS.label,
-               Literal(UNIT_LABELS[unit])))
 
-# ---- Write TTL ----
+# ---- Vectorized normalization ----
+# Clean IDs and resolve the quality/unit maps once, column-wise, so the row
+# loop only has to assemble triples.
+df["_aid"] = df["artifact_id"].astype(str).str.replace(_CLEAN_RE, "_", regex=True)
+
+df["_qk"] = df["sdc_kind"].str.strip().str.lower().map(QUALITY_MAP)
+if df["_qk"].isna().any():
+    bad = sorted(df.loc[df["_qk"].isna(), "sdc_kind"].unique())
+    raise ValueError(f"Unknown SDC kind(s): {bad}")
+
+df["_u"] = df["unit_label"].map(UNIT_MAP)
+if df["_u"].isna().any():
+    bad = sorted(df.loc[df["_u"].isna(), "unit_label"].unique())
+    raise ValueError(f"Unknown unit(s): {bad}")
+
+# Parse all timestamps in one vectorized pass instead of dateutil per row.
+df["_iso"] = (
+    pd.to_datetime(df["timestamp"], utc=True)
+    .dt.strftime("%Y-%m-%dT%H:%M:%S%z")
+    .str.replace("+0000", "Z", regex=False)
+)
+
+# Pre-build the N-Triples URI tokens with four vectorized concatenations;
+# the loop then does no per-row URI formatting at all.
+df["_au"] = "<" + EX + "Artifact_" + df["_aid"] + ">"
+df["_qu"] = "<" + EX + df["_aid"] + "_" + df["_qk"] + "_Quality>"
+df["_mu"] = "<" + EX + df["_aid"] + "_" + df["_qk"] + "_Measurement_" + df.index.astype(str) + ">"
+df["_uu"] = "<" + EX + "Unit_" + df["_u"] + ">"
+
+# ---- Stream N-Triples ----
+# Triples are written straight to an .nt file as they are produced, so no
+# in-memory Graph (and none of its per-add indexing) is built during the
+# loop.
+nt_file = output_file.with_suffix(".nt")
 output_file.parent.mkdir(parents=True, exist_ok=True)
-g.serialize(destination=str(output_file), format="turtle")
+
+
+class TripleWriter:
+    """Streams N-Triples with a Jelly-style interning table.
+
+    Jelly's encoder owes its speed to small prefix/name lookup tables that
+    collapse repeated IRI substrings to shared references. The in-process
+    equivalent is a dict mapping each distinct <...> token to one shared
+    str object: column access yields a fresh string per row, so interning
+    lets repeated subjects/units across rows reuse a single object (the
+    predicate tokens are module constants and already shared).
+    """
+
+    def __init__(self, out, batch_size):
+        self.out = out
+        self.batch_size = batch_size
+        self.pending = []
+        self.name_table = {}
+
+    def intern(self, token):
+        return self.name_table.setdefault(token, token)
+
+    def write(self, s, p, o):
+        self.pending.append(f"{s} {p} {o} .\n")
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        self.out.writelines(self.pending)
+        self.pending.clear()
+
+
+# Turtle is assembled by hand, grouped by subject, instead of going through
+# rdflib's pretty-printer (whose topological sort and prefix compaction
+# dominate serialization time). IDs are already cleaned to PN_LOCAL-safe
+# characters, so prefixed names are fine.
+TTL_HEADER = """\
+@prefix bfo: <http://purl.obolibrary.org/obo/> .
+@prefix cco: <https://www.commoncoreontologies.org/> .
+@prefix ex: <http://example.org/> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+@prefix xsd: <http://www.w3.org/2001/XMLSchema#> .
+
+"""
+
+# Shared by the Turtle and N-Triples writers: both quote literals the same
+# way, and neither format allows raw backslash, quote, LF or CR.
+_STR_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r"})
+
+
+def lit_str(x):
+    return f'"{str(x).translate(_STR_ESCAPES)}"'
+
+
+# Triples per buffered flush; amortizes the per-call write overhead the
+# same way Graph.addN amortizes per-triple add calls.
+BATCH_TRIPLES = 10_000
+
+
+work = df[["artifact_id", "_aid", "_qk", "_u", "value", "_iso", "_au", "_qu", "_mu", "_uu"]]
+ttl = io.StringIO()
+ttl.write(TTL_HEADER)
+with open(nt_file, "w", encoding="utf-8") as out:
+    writer = TripleWriter(out, BATCH_TRIPLES)
+    # itertuples(name=None) yields plain tuples: far cheaper per row than
+    # the pd.Series built by iterrows().
+    for row in work.itertuples(index=True, name=None):
+        (idx, artifact_id_raw, artifact_id, quality_kind, unit, value_raw,
+         iso_ts, artifact_uri, quality_uri, measurement_uri, unit_uri) = row
+
+        value = float(value_raw)
+
+        # Entities that repeat across rows go through the interning table;
+        # measurement tokens are unique per row, so interning them would
+        # only grow the table.
+        artifact_uri = writer.intern(artifact_uri)
+        quality_uri = writer.intern(quality_uri)
+        unit_uri = writer.intern(unit_uri)
+
+        # Artifact
+        if artifact_uri not in artifacts_seen:
+            writer.write(artifact_uri, IRI_TYPE, IRI_ARTIFACT)
+            writer.write(artifact_uri, IRI_LABEL, lit_str(artifact_id_raw))
+            ttl.write(f"ex:Artifact_{artifact_id} a cco:ont00000995 ;\n"
+                      f"    rdfs:label {lit_str(artifact_id_raw)} .\n\n")
+            artifacts_seen.add(artifact_uri)
+
+        # SDC
+        if quality_uri not in qualities_seen:
+            writer.write(artifact_uri, IRI_BEARER_OF, quality_uri)
+            writer.write(quality_uri, IRI_TYPE, IRI_SDC)
+            writer.write(quality_uri, IRI_LABEL,
+                         lit_str(f"{artifact_id_raw} {quality_kind} quality"))
+            ttl.write(f"ex:Artifact_{artifact_id} bfo:BFO_0000196 "
+                      f"ex:{artifact_id}_{quality_kind}_Quality .\n\n"
+                      f"ex:{artifact_id}_{quality_kind}_Quality a bfo:BFO_0000020 ;\n"
+                      f"    rdfs:label {lit_str(f'{artifact_id_raw} {quality_kind} quality')} .\n\n")
+            qualities_seen.add(quality_uri)
+
+        # Measurement
+        writer.write(measurement_uri, IRI_TYPE, IRI_MICE)
+        writer.write(measurement_uri, IRI_LABEL,
+                     lit_str(f"{artifact_id_raw} {quality_kind} measurement {idx}"))
+        writer.write(measurement_uri, IRI_IS_MEASURE_OF, quality_uri)
+        writer.write(measurement_uri, IRI_HAS_DATA_VALUE,
+                     f'"{value}"^^{XSD_DECIMAL}')
+        writer.write(measurement_uri, IRI_MEASUREMENT_TIME,
+                     f'"{iso_ts}"^^{XSD_DATETIME}')
+        writer.write(measurement_uri, IRI_USES_MU, unit_uri)
+        ttl.write(f"ex:{artifact_id}_{quality_kind}_Measurement_{idx} a cco:ont00001163 ;\n"
+                  f"    rdfs:label {lit_str(f'{artifact_id_raw} {quality_kind} measurement {idx}')} ;\n"
+                  f'    cco:has_data_value "{value}"^^xsd:decimal ;\n'
+                  f"    cco:measurement_time {lit_str(iso_ts)}^^xsd:dateTime ;\n"
+                  f"    cco:ont00001863 ex:Unit_{unit} ;\n"
+                  f"    cco:ont00001966 ex:{artifact_id}_{quality_kind}_Quality .\n\n")
+
+        # Unit
+        if unit_uri not in units_seen:
+            writer.write(unit_uri, IRI_TYPE, IRI_MU)
+            writer.write(unit_uri, IRI_LABEL, lit_str(UNIT_LABELS[unit]))
+            ttl.write(f"ex:Unit_{unit} a cco:ont00000120 ;\n"
+                      f"    rdfs:label {lit_str(UNIT_LABELS[unit])} .\n\n")
+            units_seen.add(unit_uri)
+
+    writer.flush()
+
+print(f"✓ N-Triples written to {nt_file}")
+
+# ---- Write TTL ----
+# The subject-grouped Turtle was assembled during the loop; one write_text
+# replaces rdflib's Turtle pretty-printer entirely.
+output_file.write_text(ttl.getvalue(), encoding="utf-8")
+
+# ---- Write Jelly (binary) ----
+# Much faster to serialize/parse than Turtle; the TTL above stays the
+# human-readable copy. Skipped quietly if pyjelly is not installed.
+try:
+    from rdflib import Graph
+    from pyjelly.integrations.rdflib.serialize import SerializerOptions
+    from pyjelly.options import LookupPreset
+except ImportError:
+    print("[measure_rdflib] pyjelly not installed; skipping .jelly output")
+else:
+    g = Graph()
+    # override/replace up front so rdflib never rescans or re-registers
+    # these prefixes while the .nt is parsed in.
+    g.namespace_manager.bind("ex", EX, override=True, replace=True)
+    g.namespace_manager.bind("cco", CCO, override=True, replace=True)
+    g.namespace_manager.bind("bfo", BFO, override=True, replace=True)
+    g.parse(nt_file, format="nt")
+    jelly_file = output_file.with_suffix(".jelly")
+    # "noprefix-sm" tuning: no prefix table, small name table.
+    g.serialize(
+        destination=str(jelly_file),
+        format="jelly",
+        options=SerializerOptions(lookup_preset=LookupPreset(max_names=256, max_prefixes=0)),
+    )
+    print(f"✓ Jelly written to {jelly_file}")
 
 print(f"✓ TTL written to {output_file}")
 print(f"✓ Artifacts: {len(artifacts_seen)}")